@@ -24,6 +24,7 @@ from __future__ import print_function
 
 import renpy
 import math
+import pygame_sdl2 as pygame
 from renpy.display.matrix cimport Matrix
 from renpy.display.render cimport Render, Matrix2D, render, MATRIX_VIEW, MATRIX_PROJECTION
 
@@ -32,6 +33,7 @@ from renpy.display.core import absolute
 
 from sdl2 cimport *
 from pygame_sdl2 cimport *
+from libc.math cimport floor, fmod
 
 import_pygame_sdl2()
 
@@ -56,6 +58,117 @@ def nogil_copy(src, dest):
         SDL_UpperBlit(src_surf, NULL, dest_surf, NULL)
 
 
+def tile_surface(src, dest, double tilew, double tileh, int xtiles, int ytiles):
+    """
+    Blits src to dest `xtiles` times horizontally and `ytiles` times
+    vertically, with each copy offset by `tilew` and `tileh` pixels from
+    the last. (Offsets are rounded down to whole pixels.)
+
+    The pixels of src are copied, not blended, as the tiles don't overlap
+    and dest is expected to be freshly cleared.
+    """
+
+    cdef SDL_Surface *src_surf
+    cdef SDL_Surface *dest_surf
+    cdef SDL_Rect rect
+    cdef SDL_BlendMode old_mode
+    cdef int x, y
+    cdef int err = 0
+
+    src_surf = PySurface_AsSurface(src)
+    dest_surf = PySurface_AsSurface(dest)
+
+    with nogil:
+        SDL_GetSurfaceBlendMode(src_surf, &old_mode)
+        SDL_SetSurfaceBlendMode(src_surf, SDL_BLENDMODE_NONE)
+
+        for y in range(ytiles):
+            for x in range(xtiles):
+                rect.x = <int> floor(x * tilew)
+                rect.y = <int> floor(y * tileh)
+                rect.w = <int> tilew
+                rect.h = <int> tileh
+
+                err = SDL_UpperBlit(src_surf, NULL, dest_surf, &rect)
+
+                if err:
+                    break
+
+            if err:
+                break
+
+        SDL_SetSurfaceBlendMode(src_surf, old_mode)
+
+    if err:
+        raise pygame.error(SDL_GetError().decode("utf-8", "replace"))
+
+
+
+################################################################################
+# Frame tiling
+################################################################################
+
+
+cdef inline double floordiv(double a, double b, double mod) nogil:
+    """
+    Returns a // b, given that mod is fmod(a, b). This rounds the same way
+    Python's float floor division does, so it agrees with mod.
+    """
+
+    cdef double div = (a - mod) / b
+    cdef double rv
+
+    if mod and ((b < 0) != (mod < 0)):
+        div -= 1.0
+
+    if not div:
+        return 0.0
+
+    rv = floor(div)
+
+    if div - rv > 0.5:
+        rv += 1.0
+
+    return rv
+
+
+def tile_dims(double cdw, double csw, double cdh, double csh, bint tile_integer, double tile_ratio):
+    """
+    Computes how a `csw` x `csh` tile is repeated to fill a `cdw` x `cdh`
+    area. Returns an (xtiles, ytiles, ctw, cth) tuple, where ctw and cth are
+    the size of the tiled area before it is scaled to fit.
+
+    If `tile_integer` is true, an edge tile is dropped if less than
+    `tile_ratio` of it would be shown, and a whole number of tiles is used.
+
+    The sizes may be floats, as they come from the frame's borders.
+    """
+
+    cdef int xtiles, ytiles
+    cdef double ctw, cth
+    cdef double xrem = fmod(cdw, csw)
+    cdef double yrem = fmod(cdh, csh)
+
+    xtiles = max(1, <int> floordiv(cdw, csw, xrem) + (1 if xrem else 0))
+    ytiles = max(1, <int> floordiv(cdh, csh, yrem) + (1 if yrem else 0))
+
+    ctw = cdw
+    cth = cdh
+
+    if tile_integer and (xrem or yrem):
+        # Area is not an exact integer number of tiles.
+
+        if xrem < tile_ratio * csw:
+            xtiles = max(1, xtiles - 1)
+        if yrem < tile_ratio * csh:
+            ytiles = max(1, ytiles - 1)
+
+        # Set size of the used tiles (ready to scale)
+        ctw = csw * xtiles
+        cth = csh * ytiles
+
+    return (xtiles, ytiles, ctw, cth)
+
 
 def get_poi(state):
     """
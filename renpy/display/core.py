@@ -1340,6 +1340,7 @@ class Interface(object):
 
         if renpy.session.get("_keep_renderer", False):
             renpy.display.render.models = renpy.display.draw.info.get("models", False)
+            renpy.display.imagelike.renderer = renpy.display.draw.info["renderer"]
             return
 
         virtual_size = (renpy.config.screen_width, renpy.config.screen_height)
@@ -1355,6 +1356,7 @@ class Interface(object):
             if draw.init(virtual_size):
                 renpy.display.draw = draw
                 renpy.display.render.models = draw.info.get("models", False)
+                renpy.display.imagelike.renderer = draw.info["renderer"]
                 break
             else:
                 pygame.display.destroy()
@@ -25,11 +25,46 @@
 from __future__ import division, absolute_import, with_statement, print_function, unicode_literals
 from renpy.compat import PY2, basestring, bchr, bord, chr, open, pystr, range, round, str, tobytes, unicode  # *
 
+import collections
 
 import renpy
 from renpy.display.render import render, Render
 from renpy.display.matrix import Matrix2D
 
+# The name of the renderer in use, from renpy.display.draw.info. This is set
+# by Interface.set_mode, so Frame doesn't need to look it up on each render.
+renderer = None
+
+# A map from color to a 1x1 solid texture of that color, shared between all
+# Solids. This is cleared when the draw object changes, or when it grows
+# larger than SOLID_TEXTURES_SIZE.
+solid_textures = {}
+solid_textures_draw = None
+
+SOLID_TEXTURES_SIZE = 256
+
+
+def get_solid_texture(color):
+    """
+    Returns a 1x1 texture filled with `color`.
+    """
+
+    global solid_textures_draw
+
+    draw = renpy.display.draw
+
+    if draw is not solid_textures_draw or len(solid_textures) >= SOLID_TEXTURES_SIZE:
+        solid_textures.clear()
+        solid_textures_draw = draw
+
+    rv = solid_textures.get(color, None)
+
+    if rv is None:
+        rv = draw.solid_texture(1, 1, color)
+        solid_textures[color] = rv
+
+    return rv
+
 
 class Solid(renpy.display.displayable.Displayable):
     """
@@ -43,6 +78,11 @@ class Solid(renpy.display.displayable.Displayable):
 
     """
 
+    nosave = ["_render_cache", "_hash"]
+
+    # The maximum number of entries in _render_cache.
+    RENDER_CACHE_SIZE = 32
+
     def __init__(self, color, **properties):
         super(Solid, self).__init__(**properties)
 
@@ -51,8 +91,19 @@ class Solid(renpy.display.displayable.Displayable):
         else:
             self.color = None
 
+        self._hash = hash(self.color)
+
+        # A map from (width, height, color) to a (draw_to_virt, tex, forward,
+        # reverse) tuple, used to avoid recomputing the texture and matrices
+        # each time this is rendered.
+        self._render_cache = collections.OrderedDict()
+
+    def after_setstate(self):
+        self._hash = hash(self.color)
+        self._render_cache = collections.OrderedDict()
+
     def __hash__(self):
-        return hash(self.color)
+        return self._hash
 
     def __eq__(self, o):
         if not self._equals(o):
@@ -73,27 +124,66 @@ class Solid(renpy.display.displayable.Displayable):
 
         rv = Render(width, height)
 
+        draw_to_virt = renpy.display.draw.draw_to_virt
+
+        key = (width, height, color)
+        cache = self._render_cache
+        entry = cache.get(key, None)
+
+        if entry is None or entry[0] is not draw_to_virt:
+            entry = self.compute_render_entry(width, height, color, draw_to_virt)
+
+            cache[key] = entry
+
+            if len(cache) > self.RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        else:
+            cache.move_to_end(key)
+
+        _, tex, forward, reverse = entry
+
+        if tex is None:
+            return rv
+
+        if forward is not None:
+            rv.forward = forward
+            rv.reverse = reverse
+
+        rv.blit(tex, (0, 0))
+
+        return rv
+
+    def compute_render_entry(self, width, height, color, draw_to_virt):
+        """
+        Computes the (draw_to_virt, tex, forward, reverse) tuple that's
+        used to render a `width` x `height` area of `color`. `tex` is None
+        if there is nothing to draw.
+        """
+
         if width and height:
-            minw, minh = renpy.display.draw.draw_to_virt.transform(1, 1)
+            minw, minh = draw_to_virt.transform(1, 1)
 
             width = max(width, minw)
             height = max(height, minh)
 
         if color is None or width <= 0 or height <= 0:
-            return rv
+            return (draw_to_virt, None, None, None)
 
-        SIZE = 10
+        # A single texel is stretched to fill the area, so the texture can be
+        # shared with every other Solid of the same color.
+        SIZE = 1
 
         if width < SIZE or height < SIZE:
             tex = renpy.display.draw.solid_texture(width, height, color)
-        else:
-            tex = renpy.display.draw.solid_texture(SIZE, SIZE, color)
-            rv.forward = Matrix2D(1.0 * SIZE / width, 0, 0, 1.0 * SIZE / height)
-            rv.reverse = Matrix2D(1.0 * width / SIZE, 0, 0, 1.0 * height / SIZE)
+            return (draw_to_virt, tex, None, None)
 
-        rv.blit(tex, (0, 0))
+        tex = get_solid_texture(color)
+        # With a single texel, the reverse matrix is just the size.
+        forward = Matrix2D(1 / width, 0, 0, 1 / height)
+        reverse = Matrix2D(width, 0, 0, height)
 
-        return rv
+        return (draw_to_virt, tex, forward, reverse)
 
 
 class Borders(object):
@@ -121,6 +211,11 @@ class Borders(object):
         four sides.
     """
 
+    # The fields that are saved when a Borders is pickled.
+    _fields = ("left", "top", "right", "bottom", "pad_left", "pad_top", "pad_right", "pad_bottom")
+
+    __slots__ = _fields + ("padding",)
+
     def __init__(self, left, top, right, bottom, pad_left=0, pad_top=0, pad_right=0, pad_bottom=0):
         self.left = left
         self.top = top
@@ -132,9 +227,25 @@ class Borders(object):
         self.pad_right = pad_right
         self.pad_bottom = pad_bottom
 
-    @property
-    def padding(self):
-        return (
+        self.compute_padding()
+
+    def __getstate__(self):
+        return {k: getattr(self, k) for k in self._fields}
+
+    def __setstate__(self, state):
+        for k in self._fields:
+            if k in state:
+                setattr(self, k, state[k])
+
+        self.compute_padding()
+
+    def compute_padding(self):
+        """
+        Computes the padding field. This needs to be called again if one of
+        the border or pad fields is changed.
+        """
+
+        self.padding = (
             self.left + self.pad_left,
             self.top + self.pad_top,
             self.right + self.pad_right,
@@ -142,6 +253,25 @@ class Borders(object):
         )
 
 
+def frame_edges(size, start, end):
+    """
+    Returns the positions of the sides of the columns (or rows) of a frame
+    that is `size` pixels across, with borders of `start` and `end`. This
+    returns a (start_end, center_start, center_end, end_start) tuple.
+
+    A border is normally measured from its own edge. A border can come out
+    negative when the child is less than 2 pixels across, in which case it
+    is measured back from the opposite edge.
+    """
+
+    start_end = start if start > 0 else size + start
+    center_start = start if start >= 0 else size + start
+    center_end = -end if end < 0 else size - end
+    end_start = -end if end <= 0 else size - end
+
+    return start_end, center_start, center_end, end_start
+
+
 class Frame(renpy.display.displayable.Displayable):
     """
     :doc: disp_imagelike
@@ -189,6 +319,8 @@ class Frame(renpy.display.displayable.Displayable):
 
     __version__ = 1
 
+    nosave = ["_bw", "_bh", "_tile_truthy", "_tile_is_integer", "_tile_ratio_f"]
+
     properties = {}
     tile_ratio = 0.5
 
@@ -247,6 +379,24 @@ class Frame(renpy.display.displayable.Displayable):
         self.right = right
         self.bottom = bottom
 
+        self.compute_layout()
+
+    def after_setstate(self):
+        self.compute_layout()
+
+    def compute_layout(self):
+        """
+        Computes values that are derived from the borders and tiling
+        parameters, so they don't need to be recomputed on each render.
+        """
+
+        self._bw = self.left + self.right
+        self._bh = self.top + self.bottom
+
+        self._tile_truthy = bool(self.tile)
+        self._tile_is_integer = self.tile == "integer"
+        self._tile_ratio_f = float(self.tile_ratio)
+
     def __repr__(self):
         return "<Frame {!r} ({},{},{},{}){}>".format(
             self.image,
@@ -258,19 +408,16 @@ class Frame(renpy.display.displayable.Displayable):
         )
 
     def __eq__(self, o):
+        if self is o:
+            return True
+
         if not self._equals(o):
             return False
 
         if self.image != o.image:
             return False
 
-        if self.left != o.left:
-            return False
-        if self.top != o.top:
-            return False
-        if self.right != o.right:
-            return False
-        if self.bottom != o.bottom:
+        if (self.left, self.top, self.right, self.bottom) != (o.left, o.top, o.right, o.bottom):
             return False
 
         if self.tile != o.tile:
@@ -282,11 +429,17 @@ class Frame(renpy.display.displayable.Displayable):
         return True
 
     def render(self, width, height, st, at):
-        width = max(self.style.xminimum, width)
-        height = max(self.style.yminimum, height)
+        style = self.style
+
+        width = max(style.xminimum, width)
+        height = max(style.yminimum, height)
+
+        tile = self._tile_truthy
+        tile_is_integer = self._tile_is_integer
+        tile_ratio = self._tile_ratio_f
 
         # The size of the final displayable.
-        if self.tile:
+        if tile:
             dw = int(width)
             dh = int(height)
         else:
@@ -299,15 +452,15 @@ class Frame(renpy.display.displayable.Displayable):
             width = max(width, minw)
             height = max(height, minh)
 
-        image = self.style.child or self.image
+        image = style.child or self.image
         crend = render(image, width, height, st, at)
 
         sw, sh = crend.get_size()
         sw = int(sw)
         sh = int(sh)
 
-        bw = self.left + self.right
-        bh = self.top + self.bottom
+        bw = self._bw
+        bh = self._bh
 
         xborder = min(bw, sw - 2, dw)
         if xborder and bw:
@@ -325,248 +478,243 @@ class Frame(renpy.display.displayable.Displayable):
             top = 0
             bottom = 0
 
-        if renpy.display.draw.info["renderer"] == "sw":
+        if renderer == "sw":
             return self.sw_render(crend, dw, dh, left, top, right, bottom)
 
-        def draw(x0, x1, y0, y1):
-            # Compute the coordinates of the left, right, top, and
-            # bottom sides of the region, for both the source and
-            # destination surfaces.
-
-            # left side.
-            if x0 >= 0:
-                dx0 = x0
-                sx0 = x0
-            else:
-                dx0 = dw + x0
-                sx0 = sw + x0
-
-            # right side.
-            if x1 > 0:
-                dx1 = x1
-                sx1 = x1
-            else:
-                dx1 = dw + x1
-                sx1 = sw + x1
-
-            # top side.
-            if y0 >= 0:
-                dy0 = y0
-                sy0 = y0
-            else:
-                dy0 = dh + y0
-                sy0 = sh + y0
-
-            # bottom side
-            if y1 > 0:
-                dy1 = y1
-                sy1 = y1
-            else:
-                dy1 = dh + y1
-                sy1 = sh + y1
-
-            # Quick exit.
-            if sx0 == sx1 or sy0 == sy1:
-                return
-
-            # Compute sizes.
-            csw = sx1 - sx0
-            csh = sy1 - sy0
-            cdw = dx1 - dx0
-            cdh = dy1 - dy0
-
-            if csw <= 0 or csh <= 0 or cdh <= 0 or cdw <= 0:
-                return
-
-            # Get a subsurface.
-            cr = crend.subsurface((sx0, sy0, csw, csh))
+        rv = Render(dw, dh)
+        rv.add_property("pixel_perfect", False)
+
+        if sw == dw and sh == dh:
+            # Every region is drawn 1:1, and together they cover the whole
+            # child, so a single subsurface does the work of all nine.
+            rv.blit(crend.subsurface((0, 0, sw, sh)), (0, 0))
+
+        elif tile:
+            state = (crend, rv, tile_is_integer, tile_ratio)
+            self.draw_pattern(self._draw_tiled_region, state, sw, sh, dw, dh, left, top, right, bottom)
+
+        else:
+            self.draw_pattern(self._draw_scaled_region, (crend, rv), sw, sh, dw, dh, left, top, right, bottom)
+
+        return rv
+
+    def _draw_scaled_region(self, state, sx0, sx1, dx0, dx1, sy0, sy1, dy0, dy1):
+        """
+        Draws a single region of a frame that isn't tiled, scaling it to fit.
+        `state` is the (crend, rv) tuple built by render, and the remaining
+        arguments give the sides of the region in the source and
+        destination, as computed by draw_pattern.
+        """
 
-            # Scale or tile if we have to.
-            if csw != cdw or csh != cdh:
-                if self.tile:
-                    ctw, cth = cdw, cdh
+        crend, rv = state
 
-                    xtiles = max(1, cdw // csw + (1 if cdw % csw else 0))
-                    ytiles = max(1, cdh // csh + (1 if cdh % csh else 0))
+        # Quick exit.
+        if sx0 == sx1 or sy0 == sy1:
+            return
 
-                    if cdw % csw or cdh % csh:
-                        # Area is not an exact integer number of tiles
+        # Compute sizes.
+        csw = sx1 - sx0
+        csh = sy1 - sy0
+        cdw = dx1 - dx0
+        cdh = dy1 - dy0
 
-                        if self.tile == "integer":
-                            if cdw % csw / float(csw) < self.tile_ratio:
-                                xtiles = max(1, xtiles - 1)
-                            if cdh % csh / float(csh) < self.tile_ratio:
-                                ytiles = max(1, ytiles - 1)
+        if csw <= 0 or csh <= 0 or cdh <= 0 or cdw <= 0:
+            return
 
-                            # Set size of the used tiles (ready to scale)
-                            ctw, cth = csw * xtiles, csh * ytiles
+        cr = crend.subsurface((sx0, sy0, csw, csh))
 
-                    newcr = Render(ctw, cth)
-                    newcr.xclipping = True
-                    newcr.yclipping = True
+        if csw != cdw or csh != cdh:
+            # Subsurface needs scaling
+            newcr = Render(cdw, cdh)
+            newcr.forward = Matrix2D(csw / cdw, 0, 0, csh / cdh)
+            newcr.reverse = Matrix2D(cdw / csw, 0, 0, cdh / csh)
+            newcr.blit(cr, (0, 0))
 
-                    for x in range(0, xtiles):
-                        for y in range(0, ytiles):
-                            newcr.blit(cr, (x * csw, y * csh))
+            cr = newcr
 
-                    csw, csh = ctw, cth
-                    cr = newcr
+        # Blit.
+        rv.blit(cr, (dx0, dy0))
 
-                if csw != cdw or csh != cdh:
-                    # Subsurface needs scaling
-                    newcr = Render(cdw, cdh)
-                    newcr.forward = Matrix2D(1.0 * csw / cdw, 0, 0, 1.0 * csh / cdh)
-                    newcr.reverse = Matrix2D(1.0 * cdw / csw, 0, 0, 1.0 * cdh / csh)
-                    newcr.blit(cr, (0, 0))
+    def _draw_tiled_region(self, state, sx0, sx1, dx0, dx1, sy0, sy1, dy0, dy1):
+        """
+        Draws a single region of a tiled frame. `state` is the (crend, rv,
+        tile_is_integer, tile_ratio) tuple built by render, and the
+        remaining arguments are as for _draw_scaled_region.
+        """
 
-                    cr = newcr
+        crend, rv, tile_is_integer, tile_ratio = state
 
-            # Blit.
-            rv.blit(cr, (dx0, dy0))
+        # Quick exit.
+        if sx0 == sx1 or sy0 == sy1:
             return
 
-        rv = Render(dw, dh)
-        rv.add_property("pixel_perfect", False)
+        # Compute sizes.
+        csw = sx1 - sx0
+        csh = sy1 - sy0
+        cdw = dx1 - dx0
+        cdh = dy1 - dy0
 
-        self.draw_pattern(draw, left, top, right, bottom)
+        if csw <= 0 or csh <= 0 or cdh <= 0 or cdw <= 0:
+            return
 
-        return rv
+        if csw == cdw and csh == cdh:
+            rv.blit(crend.subsurface((sx0, sy0, csw, csh)), (dx0, dy0))
+            return
+
+        xtiles, ytiles, ctw, cth = renpy.display.accelerator.tile_dims(  # @UndefinedVariable
+            cdw, csw, cdh, csh, tile_is_integer, tile_ratio
+        )
+
+        if ctw != cdw or cth != cdh:
+            # A whole number of tiles, scaled to fill the area. The
+            # scale is applied to the tiles directly, rather than to an
+            # intermediate tiled Render, so the offsets are scaled too.
+            cr = crend.subsurface((sx0, sy0, csw, csh))
+
+            xscale = cdw / ctw
+            yscale = cdh / cth
+
+            newcr = Render(cdw, cdh)
+            newcr.forward = Matrix2D(ctw / cdw, 0, 0, cth / cdh)
+            newcr.reverse = Matrix2D(xscale, 0, 0, yscale)
+            newcr.blit_tiled(cr, csw * xscale, csh * yscale, xtiles, ytiles, subpixel=True)
+
+            cr = newcr
+
+        elif xtiles == 1 and ytiles == 1:
+            # The area fits inside a single tile, so crop it.
+            cr = crend.subsurface((sx0, sy0, cdw, cdh))
+
+        else:
+            cr = crend.subsurface((sx0, sy0, csw, csh))
+
+            newcr = Render(cdw, cdh)
+            newcr.xclipping = True
+            newcr.yclipping = True
+            newcr.blit_tiled(cr, csw, csh, xtiles, ytiles)
+
+            cr = newcr
+
+        # Blit.
+        rv.blit(cr, (dx0, dy0))
+
+    def draw_pattern(self, draw, state, sw, sh, dw, dh, left, top, right, bottom):
+        """
+        Calls `draw` for each of the (up to) nine regions of the frame. The
+        source and destination sides of each region are resolved here, where
+        it's known which border each side is relative to, and passed to
+        `draw` as `state`, sx0, sx1, dx0, dx1, sy0, sy1, dy0, dy1.
+        """
+
+        # The sides of the columns and rows, in the source and destination.
+        sx1, sx2, sx3, sx4 = frame_edges(sw, left, right)
+        dx1, dx2, dx3, dx4 = frame_edges(dw, left, right)
+        sy1, sy2, sy3, sy4 = frame_edges(sh, top, bottom)
+        dy1, dy2, dy3, dy4 = frame_edges(dh, top, bottom)
+
+        # Do the center column and middle row have any area? If not, the
+        # regions in them would be skipped by draw, so don't call it.
+        center = sx3 > sx2 and dx3 > dx2
+        middle = sy3 > sy2 and dy3 > dy2
 
-    def draw_pattern(self, draw, left, top, right, bottom):
         # Top row.
         if top:
             if left:
-                draw(0, left, 0, top)
+                draw(state, 0, sx1, 0, dx1, 0, sy1, 0, dy1)
 
-            draw(left, -right, 0, top)
+            if center:
+                draw(state, sx2, sx3, dx2, dx3, 0, sy1, 0, dy1)
 
             if right:
-                draw(-right, 0, 0, top)
+                draw(state, sx4, sw, dx4, dw, 0, sy1, 0, dy1)
 
         # Middle row.
-        if left:
-            draw(0, left, top, -bottom)
+        if middle:
+            if left:
+                draw(state, 0, sx1, 0, dx1, sy2, sy3, dy2, dy3)
 
-        draw(left, -right, top, -bottom)
+            if center:
+                draw(state, sx2, sx3, dx2, dx3, sy2, sy3, dy2, dy3)
 
-        if right:
-            draw(-right, 0, top, -bottom)
+            if right:
+                draw(state, sx4, sw, dx4, dw, sy2, sy3, dy2, dy3)
 
         # Bottom row.
         if bottom:
             if left:
-                draw(0, left, -bottom, 0)
+                draw(state, 0, sx1, 0, dx1, sy4, sh, dy4, dh)
 
-            draw(left, -right, -bottom, 0)
+            if center:
+                draw(state, sx2, sx3, dx2, dx3, sy4, sh, dy4, dh)
 
             if right:
-                draw(-right, 0, -bottom, 0)
+                draw(state, sx4, sw, dx4, dw, sy4, sh, dy4, dh)
 
     def sw_render(self, crend, dw, dh, left, top, right, bottom):
         source = crend.render_to_texture(True)
         sw, sh = source.get_size()
 
         dest = renpy.display.swdraw.surface(dw, dh, True)
-        rv = dest
-
-        def draw(x0, x1, y0, y1):
-            # Compute the coordinates of the left, right, top, and
-            # bottom sides of the region, for both the source and
-            # destination surfaces.
-
-            # left side.
-            if x0 >= 0:
-                dx0 = x0
-                sx0 = x0
-            else:
-                dx0 = dw + x0
-                sx0 = sw + x0
-
-            # right side.
-            if x1 > 0:
-                dx1 = x1
-                sx1 = x1
-            else:
-                dx1 = dw + x1
-                sx1 = sw + x1
-
-            # top side.
-            if y0 >= 0:
-                dy0 = y0
-                sy0 = y0
-            else:
-                dy0 = dh + y0
-                sy0 = sh + y0
-
-            # bottom side
-            if y1 > 0:
-                dy1 = y1
-                sy1 = y1
-            else:
-                dy1 = dh + y1
-
-                sy1 = sh + y1
-
-            # Quick exit.
-            if sx0 == sx1 or sy0 == sy1 or dx1 <= dx0 or dy1 <= dy0:
-                return
-
-            # Compute sizes.
-            srcsize = (sx1 - sx0, sy1 - sy0)
-            dstsize = (int(dx1 - dx0), int(dy1 - dy0))
-
-            # Get a subsurface.
-            surf = source.subsurface((sx0, sy0, srcsize[0], srcsize[1]))
-
-            # Scale or tile if we have to.
-            if dstsize != srcsize:
-                if self.tile:
-                    tilew, tileh = srcsize
-                    dstw, dsth = dstsize
-
-                    xtiles = max(1, dstw // tilew + (1 if dstw % tilew else 0))
-                    ytiles = max(1, dsth // tileh + (1 if dsth % tileh else 0))
-
-                    if dstw % tilew or dsth % tileh:
-                        # Area is not an exact integer number of tiles
-
-                        if self.tile == "integer":
-                            if dstw % tilew / float(tilew) < self.tile_ratio:
-                                xtiles = max(1, xtiles - 1)
-                            if dsth % tileh / float(tileh) < self.tile_ratio:
-                                ytiles = max(1, ytiles - 1)
-
-                    # Tile at least one tile in each direction
-                    surf2 = renpy.display.pgrender.surface_unscaled((tilew * xtiles, tileh * ytiles), surf)
-
-                    for y in range(0, ytiles):
-                        for x in range(0, xtiles):
-                            surf2.blit(surf, (x * tilew, y * tileh))
-
-                    if self.tile is True:
-                        # Trim the tiled surface to required size
-                        surf = surf2.subsurface((0, 0, dstw, dsth))
-                    else:
-                        # Using integer full 'tiles' per side
-                        srcsize = (tilew * xtiles, tileh * ytiles)
-                        surf = surf2
-
-                if dstsize != srcsize:
-                    surf2 = renpy.display.scale.real_transform_scale(surf, dstsize)
-                    surf = surf2
-
-            # Blit.
-            dest.blit(surf, (dx0, dy0))
 
-        self.draw_pattern(draw, left, top, right, bottom)
+        state = (source, dest, self._tile_truthy, self._tile_is_integer, self._tile_ratio_f)
+        self.draw_pattern(self._sw_draw_region, state, sw, sh, dw, dh, left, top, right, bottom)
 
         rrv = renpy.display.render.Render(dw, dh)
-        rrv.blit(rv, (0, 0))
+        rrv.blit(dest, (0, 0))
         rrv.depends_on(crend)
 
         # And, finish up.
         return rrv
 
+    def _sw_draw_region(self, state, sx0, sx1, dx0, dx1, sy0, sy1, dy0, dy1):
+        """
+        The software-rendering equivalent of _draw_scaled_region and
+        _draw_tiled_region.
+        """
+
+        source, dest, tile, tile_is_integer, tile_ratio = state
+
+        # Quick exit.
+        if sx0 == sx1 or sy0 == sy1 or dx1 <= dx0 or dy1 <= dy0:
+            return
+
+        # Compute sizes.
+        srcsize = (sx1 - sx0, sy1 - sy0)
+        dstsize = (int(dx1 - dx0), int(dy1 - dy0))
+
+        # Get a subsurface.
+        surf = source.subsurface((sx0, sy0, srcsize[0], srcsize[1]))
+
+        # Scale or tile if we have to.
+        if dstsize != srcsize:
+            if tile:
+                tilew, tileh = srcsize
+                dstw, dsth = dstsize
+
+                xtiles, ytiles, _, _ = renpy.display.accelerator.tile_dims(  # @UndefinedVariable
+                    dstw, tilew, dsth, tileh, tile_is_integer, tile_ratio
+                )
+
+                # Tile at least one tile in each direction
+                surf2 = renpy.display.pgrender.surface_unscaled((tilew * xtiles, tileh * ytiles), surf)
+
+                renpy.display.accelerator.tile_surface(surf, surf2, tilew, tileh, xtiles, ytiles)  # @UndefinedVariable
+
+                if self.tile is True:
+                    # Trim the tiled surface to required size
+                    surf = surf2.subsurface((0, 0, dstw, dsth))
+                else:
+                    # Using integer full 'tiles' per side
+                    srcsize = (tilew * xtiles, tileh * ytiles)
+                    surf = surf2
+
+            if dstsize != srcsize:
+                surf2 = renpy.display.scale.real_transform_scale(surf, dstsize)
+                surf = surf2
+
+        # Blit.
+        dest.blit(surf, (dx0, dy0))
+
     def _duplicate(self, args):
         image = self.image._duplicate(args)
 
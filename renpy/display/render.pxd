@@ -116,6 +116,7 @@ cdef class Render:
     cpdef int blit(Render self, source, tuple pos, object focus=*, object main=*, object index=*)
     cpdef int subpixel_blit(Render self, source, tuple pos, object focus=*, object main=*, object index=*)
     cpdef int absolute_blit(Render self, source, tuple pos, object focus=*, object main=*, object index=*)
+    cpdef int blit_tiled(Render self, source, double tilew, double tileh, int xtiles, int ytiles, object focus=*, object main=*, bint subpixel=*)
 
 
 cpdef render(object d, object widtho, object heighto, double st, double at)
@@ -30,6 +30,8 @@ from renpy.display.matrix cimport Matrix, Matrix2D
 globals()["Matrix"] = Matrix
 globals()["Matrix2D"] = Matrix2D
 
+import cython
+
 import collections
 import pygame_sdl2 as pygame
 import threading
@@ -554,6 +556,9 @@ MATRIX_VIEW = 0
 MATRIX_MODEL = 1
 MATRIX_PROJECTION = 2
 
+# Many Renders are created and freed each frame, so keep the memory of freed
+# Renders around to be reused.
+@cython.freelist(128)
 cdef class Render:
 
     def __init__(Render self, float width, float height, layer_name=None): #@DuplicatedSignature
@@ -856,6 +861,42 @@ cdef class Render:
         return 0
 
 
+    cpdef int blit_tiled(Render self, source, double tilew, double tileh, int xtiles, int ytiles, object focus=True, object main=True, bint subpixel=False):
+        """
+        Blits `source` (a Render, Surface, or GL2Model) to this Render
+        `xtiles` times horizontally and `ytiles` times vertically, with
+        each copy offset by `tilew` and `tileh` pixels from the last.
+
+        This is equivalent to calling blit (or subpixel_blit, if `subpixel`
+        is true) once for each tile, but avoids the per-call overhead.
+        """
+
+        cdef int x, y
+        cdef list children
+
+        if source is self:
+            raise Exception("Blitting to self.")
+
+        if models:
+            if isinstance(source, pygame.Surface):
+                source = renpy.display.draw.load_texture(source)
+
+        children = self.children
+
+        for x in range(xtiles):
+            for y in range(ytiles):
+                if subpixel:
+                    children.append((source, x * tilew, y * tileh, focus, main))
+                else:
+                    children.append((source, int(x * tilew), int(y * tileh), focus, main))
+
+        if isinstance(source, Render):
+            self.depends_on_list.append(source)
+            source.parents.add(self)
+
+        return 0
+
+
     def get_size(self):
         """
         Returns the size of this Render, a mostly fictitious value